@@ -1,11 +1,367 @@
 import math
+import sys
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+
+GRAVITY = 9.80665
+_INV_2G = 0.5 / GRAVITY
+LN10 = math.log(10)
+_LOG_LN10_5_02 = math.log(LN10 / 5.02)
+_LOG_5_37 = math.log(5.37)
+_LOG_6_82 = math.log(6.82)
+_LOG_64 = math.log(64)
+_LOG_150 = math.log(150)
+_LOG_2712 = math.log(2712)
+
+FrictionTerms = namedtuple("FrictionTerms", "relative_roughness reynolds_number k c log_re log_inv_roughness")
+
+# Models that are not suitable for a given Reynolds number are left to None
+FrictionFactors = namedtuple("FrictionFactors", "serghides praks_pade fang bnt colebrook", defaults=(None,) * 5)
+MajorHeadLoss = namedtuple("MajorHeadLoss", FrictionFactors._fields, defaults=(None,) * 5)
+
+# Praks & Brkić's model solves Colebrook's equation like Serghide's one, it is
+# reported but kept out of the average so Colebrook is not counted twice
+_AVERAGED = tuple(index for index, field in enumerate(FrictionFactors._fields) if field != "praks_pade")
+
+# Report banners of output
+_BANNER_INIT = " For the following inital values ".center(100, "-")
+_BANNER_CALC = " The program has calculated ".center(100, "-")
+_SEP_FRICTION = "Friction factors".center(100, "~")
+_SEP_MAJOR = "Major head loss".center(100, "~")
+_SEP_MINOR = "Minor head loss".center(100, "~")
+_SEP_TOTAL = "Total head loss".center(100, "~")
+
+_MODEL_LABELS = {
+    "serghides": "1984 - Serghide's model",
+    "praks_pade": "2018 - Praks & Brkić's model",
+    "fang": "2011 - Fang's model",
+    "bnt": "2018 - BNT's model",
+    "colebrook": "1939 - Colebrook's equation",
+}
+
+
+def _prep(relative_roughness:float, reynolds_number:float):
+    """
+    Compute the terms shared by the friction factor models once
+
+    Args:
+        relative_roughness (float)
+        reynolds_number (float)
+
+    Returns:
+        FrictionTerms: Rr, Re, Rr/3.7, 2.51/Re, log(Re) and log(1/Rr)
+    """
+    log_inv_roughness = -math.log(relative_roughness) if relative_roughness > 0 else math.inf
+
+    return FrictionTerms(relative_roughness, reynolds_number, relative_roughness / 3.7, 2.51 / reynolds_number, math.log(reynolds_number), log_inv_roughness)
+
+
+def friction_factor_serghides(terms:FrictionTerms):
+    """
+    Friction factor according to the following model
+
+    Model: Serghide
+    Year: 1984
+    Paper: ?
+    Suitable Range:
+        2500 < Reynolds < 10^8
+        0 < Rr < 0.05
+
+    Args:
+        terms (FrictionTerms): Shared terms returned by _prep
+
+    Returns:
+        float: Friction factor
+    """
+
+    k = terms.k
+    c = terms.c
+    A = -2 * math.log10(k + 12 / terms.reynolds_number)
+    B = -2 * math.log10(k + c*A)
+    C = -2 * math.log10(k + c*B)
+    dBA = B - A
+
+    t = A - dBA*dBA / (C - 2*B + A)
+
+    return 1.0 / (t*t)
+
+
+def friction_factor_praks_pade(terms:FrictionTerms):
+    """
+    Friction factor according to the following model
+
+    Model: Praks, Brkić - one log call with Padé polynomials
+    Year: 2018
+    Paper: https://www.mdpi.com/1996-1073/11/7/1825
+    Suitable Range:
+        2500 < Reynolds < 10^8
+        0 < Rr < 0.05
+
+    Colebrook's equation is rewritten as z = x2 - ln(z + x1) with
+    z = ln(10) / (2 * sqrt(friction)). The only logarithm is ln(x1 + x2),
+    the Newton iterations evaluate ln(z + x1) from it with a [3/3] Padé
+    approximant of ln(1 + t).
+
+    Args:
+        terms (FrictionTerms): Shared terms returned by _prep
+
+    Returns:
+        float: Friction factor
+    """
+
+    x1 = LN10 * terms.relative_roughness * terms.reynolds_number / 18.574
+    x2 = terms.log_re + _LOG_LN10_5_02
+    w = x1 + x2
+    log_w = math.log(w)
+
+    z = x2 - log_w
+    for _ in range(3):
+        t = (z - x2) / w
+        log_z_x1 = log_w + t * (60 + t * (60 + 11*t)) / (60 + t * (90 + t * (36 + 3*t)))
+        z = z - (z - x2 + log_z_x1) / (1 + 1 / (z + x1))
+
+    return (LN10 / (2*z))**2
+
+
+def friction_factor_fang(terms:FrictionTerms):
+    """
+    Friction factor according to the following model
+
+    Model: Fang
+    Year: 2011
+    Paper: https://www.sciencedirect.com/science/article/pii/S0029549311000173
+    Suitable Range:
+        3000 < Reynolds < 10^8
+        0 < Rr < 0.05
+
+    Args:
+        terms (FrictionTerms): Shared terms returned by _prep
+
+    Returns:
+        float: Friction factor
+    """
+
+    rr_term = 0.234 * math.exp(-1.1007 * terms.log_inv_roughness)
+    re_term = 56.291 * math.exp(-1.0712 * terms.log_re) - 60.525 * math.exp(-1.1105 * terms.log_re)
+
+    L = math.log(rr_term + re_term)
+
+    return 1.613 / (L*L)
+
+
+def friction_factor_bnt(terms:FrictionTerms):
+    """
+    Friction factor according to the following model
+
+    Model: Bellos, Nalbantis, Tsakris
+    Year: 2018
+    Paper: https://ascelibrary.org/doi/full/10.1061/%28ASCE%29HY.1943-7900.0001540
+    Suitable Range:
+        3000 < Reynolds < 10^8
+
+    Args:
+        terms (FrictionTerms): Shared terms returned by _prep
+
+    Returns:
+        float: Friction factor
+    """
+
+    # Powers are written as exp(y * log(x)) to share log(Re) and log(1/Rr)
+    log_re = terms.log_re
+    log_inv_roughness = terms.log_inv_roughness
+    param_a = 1 / (1 + math.exp(8.4 * (log_re - _LOG_2712)))
+    param_b = 1 / (1 + math.exp(1.8 * (log_re - _LOG_150 - log_inv_roughness)))
+    exponent_a = 2 * (param_a - 1) * param_b
+    exponent_b = 2 * (param_a - 1) * (1 - param_b)
+    log_friction = param_a * (_LOG_64 - log_re) + exponent_a * math.log(0.75 * (log_re - _LOG_5_37))
+
+    # For a smooth pipe param_b is 1 and the roughness term vanishes, 0 * log(inf) would give nan
+    if log_inv_roughness != math.inf:
+        log_friction += exponent_b * math.log(0.88 * (_LOG_6_82 + log_inv_roughness))
+
+    return math.exp(log_friction)
+
+
+def friction_factor_colebrook(terms:FrictionTerms):
+    """
+    Friction factor solving Colebrook's equation with Halley's method
+
+    Model: Colebrook
+    Year: 1939
+    Suitable Range:
+        2500 < Reynolds < 10^8
+
+    Solves f(x) = x + 2 log10(Rr/3.7 + 2.51 x / Re) = 0 with x = 1/sqrt(friction),
+    starting from the first step of Serghide's model. The derivatives are
+    algebraic so each iteration needs a single log10, the solution is
+    reached to machine precision within 4 log10 calls.
+
+    Args:
+        terms (FrictionTerms): Shared terms returned by _prep
+
+    Returns:
+        float: Friction factor
+    """
+
+    k = terms.k
+    c = terms.c
+    x = -2 * math.log10(k + 12 / terms.reynolds_number)
+
+    for _ in range(10):
+        u = k + c*x
+        f = x + 2 * math.log10(u)
+        df = 1 + 2*c / (LN10*u)
+        d2f = -2*c*c / (LN10*u*u)
+        dx = 2*f*df / (2*df*df - f*d2f)
+        x = x - dx
+        if abs(dx) < 1e-12:
+            break
+
+    return 1 / (x*x)
+
+
+@lru_cache(maxsize=4096)
+def friction_factors(relative_roughness:float, reynolds_number:float, solve_colebrook:bool=False, praks_pade:bool=False):
+    """
+    Agregate the different friction factors based on reynolds_number,
+    results are cached for sweeps that revisit the same (Rr, Re) pairs
+
+    Args:
+        relative_roughness (float)
+        reynolds_number (float)
+        solve_colebrook (bool, optional): Use only the iterative Colebrook solution
+        praks_pade (bool, optional): Also report Praks & Brkić's model, it is not averaged
+
+    Returns:
+        FrictionFactors: Friction factors, None for the models that were not used
+    """
+    # None of the models, Colebrook's equation included, apply to Re <= 2500 and _prep cannot take Re <= 0
+    if reynolds_number <= 2500:
+        return FrictionFactors()
+
+    terms = _prep(relative_roughness, reynolds_number)
+
+    if solve_colebrook:
+        return FrictionFactors(colebrook=friction_factor_colebrook(terms))
+
+    serghides = friction_factor_serghides(terms)
+
+    # Only Serghide's model is suitable between 2500 and 3000
+    if reynolds_number <= 3000:
+        return FrictionFactors(serghides)
+
+    return FrictionFactors(serghides, friction_factor_praks_pade(terms) if praks_pade else None, friction_factor_fang(terms), friction_factor_bnt(terms))
+
+
+def major_head_loss(friction_factors:FrictionFactors, fluid_velocity:float, length_over_diameter:float, inv_2g:float):
+    """
+    Major head loss of each friction factor, averaged in the same pass
+    (Praks & Brkić's model is reported but not averaged)
+
+    Args:
+        friction_factors (FrictionFactors)
+        fluid_velocity (float)
+        length_over_diameter (float): Pipe length divided by pipe diameter
+        inv_2g (float): Inverse of twice the gravity
+
+    Returns:
+        tuple: MajorHeadLoss and average major head loss
+
+    Raises:
+        ValueError: No friction factor to average, Reynolds number is inferior or equal to 2500
+    """
+    coef = length_over_diameter * fluid_velocity * fluid_velocity * inv_2g
+    head_losses = [None if value is None else value * coef for value in friction_factors]
+    used = [head_losses[index] for index in _AVERAGED if head_losses[index] is not None]
+
+    if not used:
+        raise ValueError("No friction factor to average, none of the presented models can calculate major head losses for a Reynolds number inferior or equal to 2500")
+
+    return MajorHeadLoss._make(head_losses), sum(used) / len(used)
+
+
+def check_reynolds_range(reynolds_number:float):
+    """
+    Verifies if Reynolds number is in the correct range
+
+    Args:
+        reynolds_number (float)
+
+    Raises:
+        ValueError: Reynolds number is inferior or equal to 2500
+    """
+    if reynolds_number <= 2500:
+        raise ValueError(f"Reynolds number {reynolds_number} is inferior or equal to 2500, none of the presented models can calculate major head losses")
+
+
+@dataclass(frozen=True, slots=True)
+class HeadLossResult:
+    """
+    Results of a head loss calculation, head losses are in mCE
+    """
+    fluid_velocity: float
+    relative_roughness: float
+    reynolds_number: float
+    friction_factors: FrictionFactors
+    major_head_loss: MajorHeadLoss
+    average_major_head_loss: float
+    global_k: float
+    minor_head_loss: float
+
+    @property
+    def total_head_loss(self):
+        return self.average_major_head_loss + self.minor_head_loss
+
+
+def _compute(pipe_diameter:float, pipe_length:float, flow_rate:float, pipe_roughness:float, volumetric_mass:float, fluid_dynamic_viscosity:float, global_k:float, solve_colebrook:bool, praks_pade:bool, inv_2g:float=_INV_2G):
+    """
+    Head loss calculation with pipe diameter and roughness in meters,
+    shared by compute and PyHeadLoss.get_head_loss
+    """
+    # 1/D is shared by the velocity, the relative roughness and L/D
+    inv_diameter = 1.0 / pipe_diameter
+    fluid_velocity = flow_rate * (4 / math.pi) * inv_diameter * inv_diameter
+    reynolds_number = (volumetric_mass * fluid_velocity * pipe_diameter) / fluid_dynamic_viscosity
+    check_reynolds_range(reynolds_number)
+
+    relative_roughness = pipe_roughness * inv_diameter
+    friction_factors_tuple = friction_factors(relative_roughness, reynolds_number, solve_colebrook, praks_pade)
+    major_head_loss_tuple, average_major_head_loss = major_head_loss(friction_factors_tuple, fluid_velocity, pipe_length * inv_diameter, inv_2g)
+    minor_head_loss = global_k * fluid_velocity * fluid_velocity * inv_2g
+
+    return HeadLossResult(fluid_velocity, relative_roughness, reynolds_number, friction_factors_tuple, major_head_loss_tuple, average_major_head_loss, global_k, minor_head_loss)
+
+
+def compute(pipe_diameter:float, pipe_length:float, flow_rate:float, pipe_roughness:float, volumetric_mass:float, fluid_dynamic_viscosity:float, k_factors:list=None, solve_colebrook:bool=False, praks_pade:bool=False):
+    """
+    Calculate head losses without creating a PyHeadLoss instance
+
+    Args:
+        pipe_diameter (float): The diameter of the pipe - millimeters
+        pipe_length (float): The lenght of the pipe - meters
+        flow_rate (float): The flow rate in the pipe - m3/s
+        pipe_roughness (float): The roughness of the pipe - millimeters
+        volumetric_mass (float): The volumetric mass of the fluid - kg/m3
+        fluid_dynamic_viscosity (float): The fluid dynamic viscosity - Pa/s
+        k_factors (list, optional): Plumbing elements coefficients - units
+        solve_colebrook (bool, optional): Use only the iterative Colebrook solution instead of averaging the explicit models
+        praks_pade (bool, optional): Also report Praks & Brkić's model, it is not averaged
+
+    Returns:
+        HeadLossResult
+    """
+    global_k = sum(k_factors) if k_factors else 0.0
+
+    return _compute(pipe_diameter/1000, pipe_length, flow_rate, pipe_roughness/1000, volumetric_mass, fluid_dynamic_viscosity, global_k, solve_colebrook, praks_pade)
+
 
 class PyHeadLoss:
     """
     With inspiration from https://pypi.org/project/colebrook/#description
     """
     
-    def __init__(self, pipe_diameter:float, pipe_length:float, flow_rate:float, pipe_roughness:float, volumetric_mass:float, fluid_dynamic_viscosity:float, k_factors:list=None):
+    def __init__(self, pipe_diameter:float, pipe_length:float, flow_rate:float, pipe_roughness:float, volumetric_mass:float, fluid_dynamic_viscosity:float, k_factors:list=None, solve_colebrook:bool=False, praks_pade:bool=False, verbose:bool=True):
         """
         Class initialization
 
@@ -17,6 +373,9 @@ class PyHeadLoss:
             volumetric_mass (float): The volumetric mass of the fluid - kg/m3
             fluid_dynamic_viscosity (float): The fluid dynamic viscosity - Pa/s
             k_factors (list, optional): Plumbing elements coefficients - units
+            solve_colebrook (bool, optional): Use only the iterative Colebrook solution instead of averaging the explicit models
+            praks_pade (bool, optional): Also report Praks & Brkić's model, it is not averaged
+            verbose (bool, optional): Print the results in get_head_loss
         """
         
         self.pipe_diameter = pipe_diameter/1000
@@ -26,28 +385,40 @@ class PyHeadLoss:
         self.volumetric_mass = volumetric_mass
         self.fluid_dynamic_viscosity = fluid_dynamic_viscosity
         self.k_factors = k_factors
+        self._k_sum = sum(k_factors) if k_factors else 0.0
+        self.solve_colebrook = solve_colebrook
+        self.praks_pade = praks_pade
+        self.verbose = verbose
         
-        self.gravity = 9.80665
+        self.gravity = GRAVITY
     
-    def calculate_fluid_velocity(self):
+    def calculate_fluid_velocity(self, inv_diameter:float=None):
         """
         Flowing speed of the fluid calculous
 
+        Args:
+            inv_diameter (float, optional): 1 / pipe diameter, computed when not given
+
         Returns:
             float: Flowing speed in m/s
         """
-        surface = (math.pi * self.pipe_diameter ** 2) / 4
-        v = self.flow_rate/surface
-        return v
+        if inv_diameter is None:
+            inv_diameter = 1.0 / self.pipe_diameter
+        return self.flow_rate * (4 / math.pi) * inv_diameter * inv_diameter
     
-    def calculate_relative_roughness(self):
+    def calculate_relative_roughness(self, inv_diameter:float=None):
         """
         Relative roughness of the pipe calculous
 
+        Args:
+            inv_diameter (float, optional): 1 / pipe diameter, computed when not given
+
         Returns:
             float: Relative roughness of the pipe in standard units
         """
-        return self.pipe_roughness/self.pipe_diameter
+        if inv_diameter is None:
+            return self.pipe_roughness / self.pipe_diameter
+        return self.pipe_roughness * inv_diameter
     
     def calculate_reynolds_number(self, fluid_velocity:float):
         """
@@ -65,223 +436,154 @@ class PyHeadLoss:
     
     def check_reynolds_range(self, reynolds_number:float):
         """
-        Verifies if Reynolds number is in the correct range
-
-        Args:
-            reynolds_number (float)
-        """
-        if reynolds_number <= 2500:
-            exit("Reynolds number is inferior or equal to 2500, none of the presented models can calculate major head losses") 
-
-    def calculate_friction_factor_serghides(self, relative_roughness, reynolds_number):
-        """
-        Friction factor according to the following model
-        
-        Model: Serghide
-        Year: 1984
-        Paper: ?
-        Suitable Range:
-            2500 < Reynolds < 10^8
-            0 < Rr < 0.05
-
-        Returns:
-            float: Friction factor
-        """
-        
-        A = -2 * math.log10((relative_roughness / 3.7) + (12 / reynolds_number))
-        B = -2 * math.log10((relative_roughness / 3.7) + (2.51*A / reynolds_number))
-        C = -2 * math.log10((relative_roughness / 3.7) + (2.51*B / reynolds_number))
-        
-        return (A - (((B - A)**2) / (C - 2*B + A)))**-2
-    
-    
-    def calculate_friction_factor_fang(self, relative_roughness, reynolds_number):
-        """
-        Friction factor according to the following model
-        
-        Model: Fang
-        Year: 2011
-        Paper: https://www.sciencedirect.com/science/article/pii/S0029549311000173
-        Suitable Range:
-            3000 < Reynolds < 10^8
-            0 < Rr < 0.05
-
-        Returns:
-            float: Friction factor
-        """
-
-
-        return 1.613 * (math.log(0.234 * relative_roughness ** 1.1007 - 60.525 / reynolds_number**1.1105 + 56.291 / reynolds_number**1.0712))**-2
-    
-    
-    def calculate_friction_factor_bnt(self, relative_roughness:float, reynolds_number:float):
-        """
-        Friction factor according to the following model
-        
-        Model: Bellos, Nalbantis, Tsakris
-        Year: 2018
-        Paper: https://ascelibrary.org/doi/full/10.1061/%28ASCE%29HY.1943-7900.0001540
-        Suitable Range:
-            3000 < Reynolds < 10^8
+        Verifies if Reynolds number is in the correct range, see check_reynolds_range
 
         Args:
-            relative_roughness (float)
             reynolds_number (float)
-
-        Returns:
-            float: Friction factor
         """
+        check_reynolds_range(reynolds_number)
 
-        inv_roughness = 1 / relative_roughness
-        param_a = 1 / (1 + (reynolds_number / 2712)**8.4)
-        param_b = 1 / (1 + (reynolds_number / (150 * inv_roughness))**1.8)
-        exponent_a = 2 * (param_a - 1) * param_b
-        exponent_b = 2 * (param_a - 1) * (1 - param_b)
-        friction = (64 / reynolds_number)**param_a * (0.75 * math.log(reynolds_number / 5.37))**exponent_a * (0.88 * math.log(6.82 *inv_roughness))**exponent_b
-
-
-        return friction
-    
-    
     def calculate_friction_factors(self, relative_roughness:float, reynolds_number:float):
         """
-        Agregate the different friction factors in a dictionnary based on reynolds_number
+        Agregate the different friction factors, see friction_factors
 
         Args:
             relative_roughness (float)
             reynolds_number (float)
 
         Returns:
-            dict: Friction factors
+            FrictionFactors: Friction factors
         """
-        ffdict = {}
-        
-        if reynolds_number > 3000:
-            ffdict["1984 - Serghide's model"] = self.calculate_friction_factor_serghides(relative_roughness, reynolds_number)
-            ffdict["2011 - Fang's model"] = self.calculate_friction_factor_fang(relative_roughness, reynolds_number)
-            ffdict["2018 - BNT's model"] = self.calculate_friction_factor_bnt(relative_roughness, reynolds_number)
-
-            
-        elif reynolds_number > 2500:
-            ffdict["1984 - Serghide's model"] = self.friction_factor_serghides(relative_roughness, reynolds_number)
-            
-        return ffdict
-    
+        return friction_factors(relative_roughness, reynolds_number, self.solve_colebrook, self.praks_pade)
     
-    def calculate_major_head_loss(self, friction_factor_dict:dict, fluid_velocity:float):
+    def calculate_major_head_loss(self, friction_factors:FrictionFactors, fluid_velocity:float, length_over_diameter:float, inv_2g:float):
         """
-        Create a major head loss dictionnary according to friction factors
+        Major head losses and their average, see major_head_loss
 
         Args:
-            friction_factor_dict (dict)
+            friction_factors (FrictionFactors)
             fluid_velocity (float)
+            length_over_diameter (float): Pipe length divided by pipe diameter
+            inv_2g (float): Inverse of twice the gravity
 
         Returns:
-            dict: Major head loss dictionnary
+            tuple: MajorHeadLoss and average major head loss
         """
-        major_head_loss_dict = {}
-
-        for key, value in friction_factor_dict.items():
-            major_head_loss_dict[key] = value * (self.pipe_length / self.pipe_diameter) * ((fluid_velocity ** 2) / (2 * self.gravity))
-            
-        return major_head_loss_dict
+        return major_head_loss(friction_factors, fluid_velocity, length_over_diameter, inv_2g)
     
-    def calculate_average_major_head_loss(self, major_head_loss_dict):
+    def calculate_minor_head_loss(self, fluid_velocity:float, inv_2g:float=None):
         """
-        Calculate the average major head loss
+        Calculous of minor head losses
 
         Args:
-            major_head_loss_dict (dict)
+            fluid_velocity (float)
+            inv_2g (float, optional): Inverse of twice the gravity, computed when not given
 
         Returns:
-            float: Average major head loss
+            tuple: Global k factor and minor head losses
         """
-        v_sum = 0
-        for key, value in major_head_loss_dict.items():
-            v_sum = v_sum + value
-
-        return v_sum/3
-    
+        if inv_2g is None:
+            inv_2g = 0.5 / self.gravity
+        return self._k_sum, self._k_sum * fluid_velocity * fluid_velocity * inv_2g
     
-    def calculate_minor_head_loss(self, fluid_velocity:float):
+    def output(self, result:HeadLossResult):
         """
-        Calculous of minor head losses
+        Write the initial values and the results to stdout in a single call,
+        nothing is formatted when the class was created with verbose=False
 
         Args:
-            fluid_velocity (float)
-
-        Returns:
-            float: Minor head losses
+            result (HeadLossResult)
         """
-        k_sum = 0
-        
-        for k_factor in self.k_factors:
-            k_sum = k_sum + k_factor
+        if not self.verbose:
+            return
         
-        return k_sum, (k_sum * fluid_velocity**2 ) / (2*self.gravity)
-    
-    def output(self, fluid_velocity, relative_roughness, reynolds_number, friction_factors_dict, major_head_loss_dict, average_major_head_loss, minor_head_loss=None, global_k=None):
-        print("\n")
-        print(" For the following inital values ".center(100, "-"))
-        print(f"Pipe diameter : {self.pipe_diameter} meters")
-        print(f"Pipe length : {self.pipe_length} meters")
-        print(f"Flow rate : {self.flow_rate} m3/s")
-        print(f"Pipe roughness : {self.pipe_roughness} meters")
-        print(f"Volumetric mass : {self.volumetric_mass} kg/m3")
-        print(f"Fluid dynamic viscosity : {self.pipe_roughness} Pa/s")
+        lines = ["\n"]
+        lines.append(_BANNER_INIT)
+        lines.append(f"Pipe diameter : {self.pipe_diameter} meters")
+        lines.append(f"Pipe length : {self.pipe_length} meters")
+        lines.append(f"Flow rate : {self.flow_rate} m3/s")
+        lines.append(f"Pipe roughness : {self.pipe_roughness} meters")
+        lines.append(f"Volumetric mass : {self.volumetric_mass} kg/m3")
+        lines.append(f"Fluid dynamic viscosity : {self.fluid_dynamic_viscosity} Pa/s")
         
-        print("\n")
+        lines.append("\n")
         
-        print(" The program has calculated ".center(100, "-"))
-        print(f"Fluid_velocity : {fluid_velocity} m/s")
-        print(f"Relative roughness : {relative_roughness}")
-        print(f"Reynolds number : {reynolds_number}")
+        lines.append(_BANNER_CALC)
+        lines.append(f"Fluid_velocity : {result.fluid_velocity} m/s")
+        lines.append(f"Relative roughness : {result.relative_roughness}")
+        lines.append(f"Reynolds number : {result.reynolds_number}")
         
-        print("\n")
+        lines.append("\n")
         
-        print("Friction factors".center(100, "~"))
-        for key, value in friction_factors_dict.items():
-            print(f"{key} : {value}")
+        lines.append(_SEP_FRICTION)
+        for key, value in result.friction_factors._asdict().items():
+            if value is not None:
+                lines.append(f"{_MODEL_LABELS[key]} : {value}")
             
-        print("\n")
+        lines.append("\n")
         
-        print("Major head loss".center(100, "~"))
-        for key, value in major_head_loss_dict.items():
-            print(f"{key} : {round(value,6)} mCE") 
+        lines.append(_SEP_MAJOR)
+        for key, value in result.major_head_loss._asdict().items():
+            if value is not None:
+                lines.append(f"{_MODEL_LABELS[key]} : {round(value,6)} mCE")
             
-        print(f"Average major head loss : {round(average_major_head_loss,6)} mCE")
-        print("\n")
+        lines.append(f"Average major head loss : {round(result.average_major_head_loss,6)} mCE")
+        lines.append("\n")
         
-        if global_k:
-            print("Minor head loss".center(100, "~"))
-            print(f"Global k factor : {global_k}")
-            print(f"Minor head loss : {round(minor_head_loss, 6)} mCE")
-            print("\n")
+        if result.global_k:
+            lines.append(_SEP_MINOR)
+            lines.append(f"Global k factor : {result.global_k}")
+            lines.append(f"Minor head loss : {round(result.minor_head_loss, 6)} mCE")
+            lines.append("\n")
             
-            print("Total head loss".center(100, "~"))
-            print(f"The sum of average major head loss and minor head loss")
-            print(f"{round(minor_head_loss+average_major_head_loss, 6)} mCE")
+            lines.append(_SEP_TOTAL)
+            lines.append("The sum of average major head loss and minor head loss")
+            lines.append(f"{round(result.total_head_loss, 6)} mCE")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
     def get_head_loss(self):
         """
         The main function to calculate head loss based on arguments passed to the class
+
+        Returns:
+            HeadLossResult
         """
-        fluid_velocity = self.calculate_fluid_velocity()
-        reynolds_number = self.calculate_reynolds_number(fluid_velocity)
-        self.check_reynolds_range(reynolds_number)
-
-        relative_roughness = self.calculate_relative_roughness()
-        friction_factors_dict = self.calculate_friction_factors(relative_roughness, reynolds_number)
-        major_head_loss_dict = self.calculate_major_head_loss(friction_factors_dict, fluid_velocity)
-        average_major_head_loss = self.calculate_average_major_head_loss(major_head_loss_dict)
-        
-        if self.k_factors:
-            print("OK")
-            global_k, minor_head_loss = self.calculate_minor_head_loss(fluid_velocity)
-        else:
-            global_k = None
-            minor_head_loss = None
-            
-        self.output(fluid_velocity, relative_roughness, reynolds_number, friction_factors_dict, major_head_loss_dict, average_major_head_loss, minor_head_loss, global_k)
+        # Reciprocals are taken from the current attributes on every call so they cannot go stale,
+        # _compute derives 1/D once and shares it between the velocity, Rr and L/D
+        inv_2g = 0.5 / self.gravity
+        result = _compute(self.pipe_diameter, self.pipe_length, self.flow_rate, self.pipe_roughness, self.volumetric_mass, self.fluid_dynamic_viscosity, self._k_sum, self.solve_colebrook, self.praks_pade, inv_2g)
+        self.output(result)
+
+        return result
+
+
+def get_head_loss_batch(pipe_diameter, pipe_length, flow_rate, pipe_roughness, volumetric_mass, fluid_dynamic_viscosity, global_k=0.0):
+    """
+    Calculate head losses for a set of pipes with the compiled Numba kernel,
+    all arguments are broadcast against each other
+
+    Args:
+        pipe_diameter (array_like): The diameter of the pipes - millimeters
+        pipe_length (array_like): The lenght of the pipes - meters
+        flow_rate (array_like): The flow rate in the pipes - m3/s
+        pipe_roughness (array_like): The roughness of the pipes - millimeters
+        volumetric_mass (array_like): The volumetric mass of the fluid - kg/m3
+        fluid_dynamic_viscosity (array_like): The fluid dynamic viscosity - Pa/s
+        global_k (array_like, optional): Sum of the plumbing elements coefficients of each pipe - units
+
+    Returns:
+        tuple: Average major head losses and minor head losses arrays - mCE
+    """
+    import numpy as np
+    from _kernels import _head_loss_batch
+
+    arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (pipe_diameter, pipe_length, flow_rate, pipe_roughness, volumetric_mass, fluid_dynamic_viscosity, global_k)))
+    shape = arrays[0].shape
+    pipe_diameter, pipe_length, flow_rate, pipe_roughness, volumetric_mass, fluid_dynamic_viscosity, global_k = (np.ascontiguousarray(a).ravel() for a in arrays)
 
+    major_head_loss = np.empty_like(pipe_diameter)
+    minor_head_loss = np.empty_like(pipe_diameter)
+    _head_loss_batch(pipe_diameter / 1000, pipe_length, flow_rate, pipe_roughness / 1000, volumetric_mass, fluid_dynamic_viscosity, global_k, major_head_loss, minor_head_loss)
 
+    return major_head_loss.reshape(shape), minor_head_loss.reshape(shape)
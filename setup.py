@@ -0,0 +1,18 @@
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    # The Cython kernels are optional, the pure Python modules install without them
+    ext_modules = []
+else:
+    extensions = [
+        Extension("_pyheadloss_c", ["_pyheadloss_c.pyx"], extra_compile_args=["-O3", "-ffast-math", "-fno-finite-math-only"], libraries=["m"]),
+    ]
+    ext_modules = cythonize(extensions, compiler_directives={"boundscheck": False, "wraparound": False, "cdivision": True})
+
+setup(
+    name="PyHeadLoss",
+    py_modules=["PyHeadLoss", "vectorized", "_kernels"],
+    ext_modules=ext_modules,
+)
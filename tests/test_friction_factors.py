@@ -0,0 +1,267 @@
+import math
+
+import pytest
+
+from PyHeadLoss import (
+    FrictionFactors,
+    PyHeadLoss,
+    _prep,
+    compute,
+    friction_factor_bnt,
+    friction_factor_colebrook,
+    friction_factor_fang,
+    friction_factor_praks_pade,
+    friction_factor_serghides,
+    friction_factors,
+    major_head_loss,
+)
+
+REYNOLDS_NUMBERS = [2600, 3000, 1e4, 1e5, 1e6, 1e7, 1e8]
+RELATIVE_ROUGHNESSES = [0, 1e-6, 1e-4, 1e-3, 0.01, 0.05]
+
+# Pipes as (diameter mm, flow rate m3/s, roughness mm)
+PIPES = [
+    (100, 0.002, 0.5),
+    (200, 0.05, 0.01),
+]
+
+
+def colebrook_fixed_point(relative_roughness, reynolds_number):
+    x = 8.0
+    for _ in range(500):
+        x = -2 * math.log10(relative_roughness / 3.7 + 2.51 * x / reynolds_number)
+    return 1 / (x*x)
+
+
+@pytest.mark.parametrize("reynolds_number", REYNOLDS_NUMBERS)
+@pytest.mark.parametrize("relative_roughness", RELATIVE_ROUGHNESSES)
+def test_colebrook_matches_fixed_point(relative_roughness, reynolds_number):
+    pipe = PyHeadLoss(100, 100, 0.002, 0.5, 1000, 0.001, solve_colebrook=True)
+    expected = colebrook_fixed_point(relative_roughness, reynolds_number)
+    colebrook = friction_factor_colebrook(_prep(relative_roughness, reynolds_number))
+    assert colebrook == pytest.approx(expected, rel=1e-12)
+    assert pipe.calculate_friction_factors(relative_roughness, reynolds_number) == FrictionFactors(colebrook=colebrook)
+
+
+@pytest.mark.parametrize("reynolds_number", REYNOLDS_NUMBERS)
+@pytest.mark.parametrize("relative_roughness", RELATIVE_ROUGHNESSES)
+def test_praks_pade_matches_fixed_point(relative_roughness, reynolds_number):
+    expected = colebrook_fixed_point(relative_roughness, reynolds_number)
+    assert friction_factor_praks_pade(_prep(relative_roughness, reynolds_number)) == pytest.approx(expected, rel=1e-7)
+
+
+def test_bnt_smooth_pipe_is_the_rough_limit():
+    smooth = friction_factor_bnt(_prep(0.0, 1e5))
+    assert math.isfinite(smooth)
+    assert friction_factor_bnt(_prep(1e-12, 1e5)) == pytest.approx(smooth, rel=1e-6)
+
+
+@pytest.mark.filterwarnings("error")
+def test_vectorized_models_match_scalar():
+    np = pytest.importorskip("numpy")
+    import vectorized
+
+    relative_roughness = np.repeat(RELATIVE_ROUGHNESSES, len(REYNOLDS_NUMBERS))
+    reynolds_number = np.tile(np.array(REYNOLDS_NUMBERS, dtype=float), len(RELATIVE_ROUGHNESSES))
+    for vectorized_model, scalar_model in (
+        (vectorized.serghides, friction_factor_serghides),
+        (vectorized.praks_pade, friction_factor_praks_pade),
+        (vectorized.fang, friction_factor_fang),
+        (vectorized.bnt, friction_factor_bnt),
+    ):
+        expected = [scalar_model(_prep(rr, re)) for rr, re in zip(relative_roughness, reynolds_number)]
+        np.testing.assert_allclose(vectorized_model(relative_roughness, reynolds_number), expected, rtol=1e-12)
+
+
+def test_vectorized_models_accept_lists_and_scalars():
+    np = pytest.importorskip("numpy")
+    import vectorized
+
+    for model in (vectorized.serghides, vectorized.praks_pade, vectorized.fang, vectorized.bnt):
+        values = model([0.005, 0.0], [1e5, 1e5])
+        np.testing.assert_allclose(values, model(np.array([0.005, 0.0]), np.array([1e5, 1e5])), rtol=0)
+        assert model(0.005, 100000) == values[0]
+
+
+def scalar_average_major_head_loss(pipes=PIPES):
+    return [compute(diameter, 100, flow_rate, roughness, 1000, 0.001).average_major_head_loss for diameter, flow_rate, roughness in pipes]
+
+
+def test_vectorized_head_loss_matches_scalar():
+    np = pytest.importorskip("numpy")
+    from vectorized import get_head_loss
+
+    diameter, flow_rate, roughness = (np.array(column, dtype=float) for column in zip(*PIPES))
+    results = get_head_loss(diameter, 100, flow_rate, roughness, 1000, 0.001)
+    np.testing.assert_allclose(results["average_major_head_loss"], scalar_average_major_head_loss(), rtol=1e-12)
+
+
+def test_numba_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    from PyHeadLoss import get_head_loss_batch
+
+    diameter, flow_rate, roughness = (np.array(column, dtype=float) for column in zip(*PIPES))
+    major, minor = get_head_loss_batch(diameter, 100, flow_rate, roughness, 1000, 0.001, 19)
+    np.testing.assert_allclose(major, scalar_average_major_head_loss(), rtol=1e-9)
+    assert np.isnan(get_head_loss_batch(100, 100, 0.00006, 0.5, 1000, 0.001)[0])
+    velocity = flow_rate / (np.pi * (diameter / 1000) ** 2 / 4)
+    np.testing.assert_allclose(minor, 19 * velocity ** 2 / (2 * 9.80665), rtol=1e-12)
+
+    smooth_pipes = [(100, 0.002, 0.0), (50, 0.003, 0.0)]
+    diameter, flow_rate, roughness = (np.array(column, dtype=float) for column in zip(*smooth_pipes))
+    np.testing.assert_allclose(get_head_loss_batch(diameter, 100, flow_rate, roughness, 1000, 0.001)[0], scalar_average_major_head_loss(smooth_pipes), rtol=1e-9)
+
+
+def test_average_major_head_loss_over_the_models():
+    pipe = PyHeadLoss(100, 100, 0.002, 0.5, 1000, 0.001)
+    major_head_loss, average_major_head_loss = pipe.calculate_major_head_loss(FrictionFactors(serghides=0.02, fang=0.03), 1.0, 1.0, 1.0)
+    assert major_head_loss.praks_pade is None and major_head_loss.bnt is None
+    assert average_major_head_loss == pytest.approx((major_head_loss.serghides + major_head_loss.fang) / 2)
+
+    with pytest.raises(ValueError):
+        pipe.calculate_major_head_loss(FrictionFactors(), 1.0, 1.0, 1.0)
+
+
+def test_praks_pade_is_reported_on_request_and_not_averaged():
+    assert compute(100, 100, 0.002, 0.5, 1000, 0.001).friction_factors.praks_pade is None
+
+    result = compute(100, 100, 0.002, 0.5, 1000, 0.001, praks_pade=True)
+    head_loss = result.major_head_loss
+    assert head_loss.praks_pade is not None
+    assert result.average_major_head_loss == pytest.approx((head_loss.serghides + head_loss.fang + head_loss.bnt) / 3)
+
+
+def test_serghide_only_between_2500_and_3000():
+    factors = friction_factors(0.005, 2800.0)
+    assert factors.serghides is not None
+    assert factors.praks_pade is None and factors.fang is None and factors.bnt is None
+    factors = friction_factors(0.005, 3001.0)
+    assert None not in (factors.serghides, factors.fang, factors.bnt)
+
+
+def test_friction_factors_are_cached():
+    friction_factors.cache_clear()
+    first = friction_factors(0.005, 1e5)
+    assert friction_factors(0.005, 1e5) is first
+    assert friction_factors.cache_info().hits == 1
+
+
+def test_low_reynolds_number_raises():
+    with pytest.raises(ValueError):
+        compute(100, 100, 0.00006, 0.5, 1000, 0.001)
+
+
+@pytest.mark.parametrize("reynolds_number", [-1.0, 0.0, 2000.0])
+@pytest.mark.parametrize("solve_colebrook", [False, True])
+def test_friction_factors_are_empty_below_2500(reynolds_number, solve_colebrook):
+    factors = friction_factors(0.005, reynolds_number, solve_colebrook)
+    assert factors == FrictionFactors()
+    with pytest.raises(ValueError):
+        major_head_loss(factors, 1.0, 1.0, 1.0)
+
+
+def test_output_is_written_once(monkeypatch):
+    writes = []
+    monkeypatch.setattr("sys.stdout.write", writes.append)
+    result = PyHeadLoss(100, 100, 0.002, 0.5, 1000, 0.001, [7, 4, 8]).get_head_loss()
+    assert len(writes) == 1
+    assert f"{round(result.total_head_loss, 6)} mCE" in writes[0]
+
+
+def test_output_banners(capsys):
+    PyHeadLoss(100, 100, 0.002, 0.5, 1000, 0.001, [7, 4, 8]).get_head_loss()
+    lines = capsys.readouterr().out.split("\n")
+    banners = [line for line in lines if line.startswith(("-", "~"))]
+    assert banners == [
+        " For the following inital values ".center(100, "-"),
+        " The program has calculated ".center(100, "-"),
+        "Friction factors".center(100, "~"),
+        "Major head loss".center(100, "~"),
+        "Minor head loss".center(100, "~"),
+        "Total head loss".center(100, "~"),
+    ]
+    assert "1984 - Serghide's model : 0.0" in "\n".join(lines)
+
+
+def test_verbose_false_writes_nothing(capsys):
+    PyHeadLoss(100, 100, 0.002, 0.5, 1000, 0.001, [7, 4, 8], verbose=False).get_head_loss()
+    assert capsys.readouterr().out == ""
+
+
+def test_class_matches_compute():
+    pipe = PyHeadLoss(100, 100, 0.002, 0.5, 1000, 0.001, [7, 4, 8], verbose=False)
+    result = pipe.get_head_loss()
+    expected = compute(100, 100, 0.002, 0.5, 1000, 0.001, [7, 4, 8])
+    assert result == expected
+    assert expected.total_head_loss == pytest.approx(expected.average_major_head_loss + 19 * expected.fluid_velocity**2 / (2 * 9.80665))
+
+    pipe.gravity = pipe.gravity / 2
+    assert pipe.get_head_loss().total_head_loss == pytest.approx(2 * expected.total_head_loss)
+
+
+def test_class_steps_follow_attribute_changes():
+    pipe = PyHeadLoss(100, 100, 0.002, 0.5, 1000, 0.001, [7, 4, 8], verbose=False)
+    inv_diameter = 1.0 / pipe.pipe_diameter
+    fluid_velocity = pipe.calculate_fluid_velocity()
+    assert pipe.calculate_fluid_velocity(inv_diameter) == fluid_velocity
+    assert pipe.calculate_relative_roughness(inv_diameter) == pytest.approx(pipe.calculate_relative_roughness())
+    assert pipe.calculate_minor_head_loss(fluid_velocity, 0.5 / pipe.gravity) == pipe.calculate_minor_head_loss(fluid_velocity)
+
+    pipe.pipe_diameter = 2 * pipe.pipe_diameter
+    assert pipe.calculate_fluid_velocity() == pytest.approx(fluid_velocity / 4)
+    assert pipe.get_head_loss().fluid_velocity == pytest.approx(fluid_velocity / 4)
+
+
+def test_vectorized_masks_low_reynolds_number():
+    np = pytest.importorskip("numpy")
+    from vectorized import get_head_loss
+
+    results = get_head_loss([100, 100], 100, [0.002, 0.00006], 0.5, 1000, 0.001)
+    assert np.isfinite(results["average_major_head_loss"][0])
+    assert np.isnan(results["average_major_head_loss"][1])
+
+
+def test_vectorized_praks_pade_is_reported_on_request():
+    np = pytest.importorskip("numpy")
+    from vectorized import get_head_loss
+
+    results = get_head_loss(100, 100, 0.002, 0.5, 1000, 0.001)
+    assert "friction_factor_praks_pade" not in results
+
+    with_praks_pade = get_head_loss(100, 100, 0.002, 0.5, 1000, 0.001, praks_pade=True)
+    assert with_praks_pade["friction_factor_praks_pade"] == pytest.approx(compute(100, 100, 0.002, 0.5, 1000, 0.001, praks_pade=True).friction_factors.praks_pade)
+    assert with_praks_pade["average_major_head_loss"] == pytest.approx(results["average_major_head_loss"])
+
+
+def test_pipe_network_matches_scalar():
+    np = pytest.importorskip("numpy")
+    from vectorized import PipeNetwork
+
+    diameter, flow_rate, roughness = zip(*PIPES)
+    network = PipeNetwork(diameter, 100, flow_rate, roughness, 1000, 0.001, 19)
+    assert len(network) == len(PIPES)
+    assert network.pipe_length.flags.c_contiguous and network.pipe_length.shape == (len(PIPES),)
+
+    results = network.get_head_loss()
+    expected = [compute(diameter, 100, flow_rate, roughness, 1000, 0.001, [19]) for diameter, flow_rate, roughness in PIPES]
+    np.testing.assert_allclose(results["reynolds_number"], [result.reynolds_number for result in expected], rtol=1e-12)
+    np.testing.assert_allclose(results["total_head_loss"], [result.total_head_loss for result in expected], rtol=1e-12)
+
+
+def test_cython_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    _pyheadloss_c = pytest.importorskip("_pyheadloss_c")
+
+    relative_roughness = np.append(np.repeat(RELATIVE_ROUGHNESSES, len(REYNOLDS_NUMBERS)), 0.005)
+    reynolds_number = np.append(np.tile(np.array(REYNOLDS_NUMBERS, dtype=float), len(RELATIVE_ROUGHNESSES)), 2000.0)
+    out = np.empty_like(reynolds_number)
+    _pyheadloss_c.batch(relative_roughness, reynolds_number, out)
+
+    expected = []
+    for rr, re in zip(relative_roughness[:-1], reynolds_number[:-1]):
+        factors = friction_factors(float(rr), float(re))
+        used = [value for value in (factors.serghides, factors.fang, factors.bnt) if value is not None]
+        expected.append(sum(used) / len(used))
+    np.testing.assert_allclose(out[:-1], expected, rtol=1e-9)
+    assert np.isnan(out[-1])
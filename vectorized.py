@@ -0,0 +1,265 @@
+"""
+NumPy counterparts of the PyHeadLoss calculations.
+
+Every function accepts scalars or arrays and broadcasts them, so a whole
+set of pipes can be evaluated in a single pass instead of one PyHeadLoss
+instance per pipe.
+"""
+
+import numpy as np
+
+GRAVITY = 9.80665
+LN10 = np.log(10)
+
+
+def serghides(relative_roughness, reynolds_number):
+    """
+    Friction factor according to Serghide's model (1984)
+
+    Args:
+        relative_roughness (array_like)
+        reynolds_number (array_like)
+
+    Returns:
+        ndarray: Friction factors
+    """
+    relative_roughness = np.asarray(relative_roughness, dtype=float)
+    reynolds_number = np.asarray(reynolds_number, dtype=float)
+    A = -2 * np.log10((relative_roughness / 3.7) + (12 / reynolds_number))
+    B = -2 * np.log10((relative_roughness / 3.7) + (2.51*A / reynolds_number))
+    C = -2 * np.log10((relative_roughness / 3.7) + (2.51*B / reynolds_number))
+
+    t = A - (((B - A)**2) / (C - 2*B + A))
+
+    return np.reciprocal(t*t)
+
+
+def praks_pade(relative_roughness, reynolds_number):
+    """
+    Friction factor according to Praks & Brkić's one log call model (2018)
+
+    Args:
+        relative_roughness (array_like)
+        reynolds_number (array_like)
+
+    Returns:
+        ndarray: Friction factors
+    """
+    relative_roughness = np.asarray(relative_roughness, dtype=float)
+    reynolds_number = np.asarray(reynolds_number, dtype=float)
+    x1 = LN10 * relative_roughness * reynolds_number / 18.574
+    x2 = np.log(LN10 * reynolds_number / 5.02)
+    w = x1 + x2
+    log_w = np.log(w)
+
+    z = x2 - log_w
+    for _ in range(3):
+        t = (z - x2) / w
+        log_z_x1 = log_w + t * (60 + t * (60 + 11*t)) / (60 + t * (90 + t * (36 + 3*t)))
+        z = z - (z - x2 + log_z_x1) / (1 + 1 / (z + x1))
+
+    return (LN10 / (2*z))**2
+
+
+def fang(relative_roughness, reynolds_number):
+    """
+    Friction factor according to Fang's model (2011)
+
+    Args:
+        relative_roughness (array_like)
+        reynolds_number (array_like)
+
+    Returns:
+        ndarray: Friction factors
+    """
+    relative_roughness = np.asarray(relative_roughness, dtype=float)
+    reynolds_number = np.asarray(reynolds_number, dtype=float)
+    L = np.log(0.234 * relative_roughness ** 1.1007 - 60.525 / reynolds_number**1.1105 + 56.291 / reynolds_number**1.0712)
+
+    return 1.613 / (L*L)
+
+
+def bnt(relative_roughness, reynolds_number):
+    """
+    Friction factor according to Bellos, Nalbantis, Tsakris's model (2018)
+
+    Args:
+        relative_roughness (array_like)
+        reynolds_number (array_like)
+
+    Returns:
+        ndarray: Friction factors
+    """
+    relative_roughness = np.asarray(relative_roughness, dtype=float)
+    reynolds_number = np.asarray(reynolds_number, dtype=float)
+
+    # Smooth pipes give an infinite inverse roughness, the limit is handled by inf**0 == 1
+    with np.errstate(divide="ignore"):
+        inv_roughness = 1 / relative_roughness
+    param_a = 1 / (1 + (reynolds_number / 2712)**8.4)
+    param_b = 1 / (1 + (reynolds_number / (150 * inv_roughness))**1.8)
+    exponent_a = 2 * (param_a - 1) * param_b
+    exponent_b = 2 * (param_a - 1) * (1 - param_b)
+
+    return (64 / reynolds_number)**param_a * (0.75 * np.log(reynolds_number / 5.37))**exponent_a * (0.88 * np.log(6.82 * inv_roughness))**exponent_b
+
+
+# Averaged models, Praks & Brkić's one is only appended on request (see PyHeadLoss._AVERAGED)
+MODELS = ("serghides", "fang", "bnt")
+_FUNCTIONS = {"serghides": serghides, "praks_pade": praks_pade, "fang": fang, "bnt": bnt}
+
+
+class PipeNetwork:
+    """
+    A set of pipes stored as one contiguous float64 array per attribute,
+    every calculation runs elementwise over the whole network
+    """
+
+    def __init__(self, pipe_diameter, pipe_length, flow_rate, pipe_roughness, volumetric_mass, fluid_dynamic_viscosity, global_k=0.0, praks_pade=False):
+        """
+        Class initialization, all arguments but praks_pade are broadcast
+        against each other and flattened to 1-D arrays
+
+        Args:
+            pipe_diameter (array_like): The diameter of the pipes - millimeters
+            pipe_length (array_like): The lenght of the pipes - meters
+            flow_rate (array_like): The flow rate in the pipes - m3/s
+            pipe_roughness (array_like): The roughness of the pipes - millimeters
+            volumetric_mass (array_like): The volumetric mass of the fluid - kg/m3
+            fluid_dynamic_viscosity (array_like): The fluid dynamic viscosity - Pa/s
+            global_k (array_like, optional): Sum of the plumbing elements coefficients of each pipe - units
+            praks_pade (bool, optional): Also report Praks & Brkić's model, it is not averaged
+        """
+        arrays = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (pipe_diameter, pipe_length, flow_rate, pipe_roughness, volumetric_mass, fluid_dynamic_viscosity, global_k)))
+        pipe_diameter, pipe_length, flow_rate, pipe_roughness, volumetric_mass, fluid_dynamic_viscosity, global_k = (np.ascontiguousarray(a).ravel() for a in arrays)
+
+        self.pipe_diameter = pipe_diameter / 1000
+        self.pipe_length = pipe_length
+        self.flow_rate = flow_rate
+        self.pipe_roughness = pipe_roughness / 1000
+        self.volumetric_mass = volumetric_mass
+        self.fluid_dynamic_viscosity = fluid_dynamic_viscosity
+        self.global_k = global_k
+        self.models = MODELS + ("praks_pade",) if praks_pade else MODELS
+
+    def __len__(self):
+        return self.pipe_diameter.shape[0]
+
+    def calculate_fluid_velocity(self):
+        """
+        Flowing speed of the fluid calculous
+
+        Returns:
+            ndarray: Flowing speed in m/s
+        """
+        return self.flow_rate / ((np.pi * self.pipe_diameter ** 2) / 4)
+
+    def calculate_relative_roughness(self):
+        """
+        Relative roughness of the pipes calculous
+
+        Returns:
+            ndarray: Relative roughness of the pipes in standard units
+        """
+        return self.pipe_roughness / self.pipe_diameter
+
+    def calculate_reynolds_number(self, fluid_velocity):
+        """
+        Reynolds number calculous
+        https://en.wikipedia.org/wiki/Reynolds_number
+
+        Args:
+            fluid_velocity (ndarray): The velocity of the fluid in m/s
+
+        Returns:
+            ndarray: Reynolds numbers
+        """
+        return (self.volumetric_mass * fluid_velocity * self.pipe_diameter) / self.fluid_dynamic_viscosity
+
+    def calculate_friction_factors(self, relative_roughness, reynolds_number):
+        """
+        Friction factors of every model in self.models
+
+        Args:
+            relative_roughness (ndarray)
+            reynolds_number (ndarray)
+
+        Returns:
+            ndarray: Friction factors of shape (len(self.models), len(self)), rows follow self.models,
+            nan where the Reynolds number is inferior or equal to 2500
+        """
+        mask = reynolds_number > 2500
+        rr = relative_roughness[mask]
+        re = reynolds_number[mask]
+
+        friction_factors = np.full((len(self.models), reynolds_number.shape[0]), np.nan)
+        friction_factors[:, mask] = np.stack([_FUNCTIONS[model](rr, re) for model in self.models])
+
+        return friction_factors
+
+    def calculate_average_friction_factor(self, friction_factors, reynolds_number):
+        """
+        Average the models listed in MODELS, only Serghide's model is suitable between 2500 and 3000
+
+        Args:
+            friction_factors (ndarray): Output of calculate_friction_factors
+            reynolds_number (ndarray)
+
+        Returns:
+            ndarray: Friction factor of each pipe
+        """
+        return np.where(reynolds_number > 3000, friction_factors[:len(MODELS)].mean(axis=0), friction_factors[0])
+
+    def get_head_loss(self):
+        """
+        Calculate head losses of every pipe of the network
+
+        Returns:
+            dict: Arrays of the calculated values, keyed by name
+        """
+        fluid_velocity = self.calculate_fluid_velocity()
+        relative_roughness = self.calculate_relative_roughness()
+        reynolds_number = self.calculate_reynolds_number(fluid_velocity)
+
+        friction_factors = self.calculate_friction_factors(relative_roughness, reynolds_number)
+        friction_factor = self.calculate_average_friction_factor(friction_factors, reynolds_number)
+
+        velocity_head = fluid_velocity ** 2 / (2 * GRAVITY)
+        average_major_head_loss = friction_factor * (self.pipe_length / self.pipe_diameter) * velocity_head
+        minor_head_loss = self.global_k * velocity_head
+
+        results = {
+            "fluid_velocity": fluid_velocity,
+            "relative_roughness": relative_roughness,
+            "reynolds_number": reynolds_number,
+        }
+        for model, values in zip(self.models, friction_factors):
+            results[f"friction_factor_{model}"] = values
+        results["average_major_head_loss"] = average_major_head_loss
+        results["minor_head_loss"] = minor_head_loss
+        results["total_head_loss"] = average_major_head_loss + minor_head_loss
+
+        return results
+
+
+def get_head_loss(pipe_diameter, pipe_length, flow_rate, pipe_roughness, volumetric_mass, fluid_dynamic_viscosity, global_k=0.0, praks_pade=False):
+    """
+    Calculate head losses for a set of pipes, all arguments but praks_pade are broadcast against each other
+
+    Args:
+        pipe_diameter (array_like): The diameter of the pipes - millimeters
+        pipe_length (array_like): The lenght of the pipes - meters
+        flow_rate (array_like): The flow rate in the pipes - m3/s
+        pipe_roughness (array_like): The roughness of the pipes - millimeters
+        volumetric_mass (array_like): The volumetric mass of the fluid - kg/m3
+        fluid_dynamic_viscosity (array_like): The fluid dynamic viscosity - Pa/s
+        global_k (array_like, optional): Sum of the plumbing elements coefficients of each pipe - units
+        praks_pade (bool, optional): Also report Praks & Brkić's model, it is not averaged
+
+    Returns:
+        dict: Arrays of the calculated values, keyed by name, shaped like the broadcast arguments
+    """
+    shape = np.broadcast_shapes(*(np.shape(a) for a in (pipe_diameter, pipe_length, flow_rate, pipe_roughness, volumetric_mass, fluid_dynamic_viscosity, global_k)))
+    results = PipeNetwork(pipe_diameter, pipe_length, flow_rate, pipe_roughness, volumetric_mass, fluid_dynamic_viscosity, global_k, praks_pade).get_head_loss()
+
+    return {key: value.reshape(shape) for key, value in results.items()}